@@ -0,0 +1,160 @@
+import hashlib
+import logging
+import os
+import time
+from typing import Optional
+import anyio.from_thread
+import orjson
+from fastapi import Request, Response
+from sqlalchemy.exc import DBAPIError
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.inmemory import InMemoryBackend
+from fastapi_cache.coder import Coder
+
+logger = logging.getLogger(__name__)
+
+REDIS_URL = os.getenv("REDIS_URL")
+CACHE_PREFIX = "enroll"
+CACHED_HEADERS = ("x-next-cursor", "etag")
+STALE_PREFIX = "stale"
+STALE_PATHS = ("/students", "/courses", "/enrollments", "/grades")
+# Only the query params the list routes accept, in a fixed order
+STALE_QUERY_PARAMS = ("skip", "limit", "after_id")
+STALE_TTL = int(os.getenv("STALE_TTL", str(7 * 24 * 3600)))
+# Unchanged bodies are still rewritten this often, restoring hashes Redis expired or evicted
+STALE_REFRESH_INTERVAL = min(int(os.getenv("STALE_REFRESH_INTERVAL", "300")), STALE_TTL // 2)
+STALE_TRACKED_KEYS = 10000
+CACHE_HIT_HEADER = "X-Cache-Hit"
+
+# key -> (body digest, write time) of the last stale copy this process stored
+_stale_written = {}
+
+redis_client = None
+
+def init_cache() -> None:
+    global redis_client
+    # Caching is only enabled when a Redis instance is configured
+    if REDIS_URL:
+        from redis import asyncio as aioredis
+        from fastapi_cache.backends.redis import RedisBackend
+        redis_client = aioredis.from_url(REDIS_URL)
+        FastAPICache.init(RedisBackend(redis_client), prefix=CACHE_PREFIX)
+    else:
+        FastAPICache.init(InMemoryBackend(), prefix=CACHE_PREFIX, enable=False)
+
+async def _clear_namespace(namespace: str) -> None:
+    # SCAN in batches instead of a blocking KEYS over the whole keyspace
+    batch = []
+    async for key in redis_client.scan_iter(match=f"{CACHE_PREFIX}:{namespace}:*", count=500):
+        batch.append(key)
+        if len(batch) >= 500:
+            await redis_client.unlink(*batch)
+            batch = []
+    if batch:
+        await redis_client.unlink(*batch)
+
+def invalidate(*namespaces: str) -> None:
+    # Called from sync handlers, which run in AnyIO worker threads after the write has committed
+    if redis_client is None:
+        return
+    from redis.exceptions import RedisError
+    for namespace in namespaces:
+        try:
+            anyio.from_thread.run(_clear_namespace, namespace)
+        except RedisError:
+            logger.warning("Failed to invalidate cache namespace %s", namespace, exc_info=True)
+
+def request_key_builder(
+    func,
+    namespace: Optional[str] = "",
+    request: Optional[Request] = None,
+    response: Optional[Response] = None,
+    args: Optional[tuple] = None,
+    kwargs: Optional[dict] = None,
+) -> str:
+    # Key on the URL only; the injected db session differs on every request
+    url = f"{request.url.path}?{request.url.query}"
+    digest = hashlib.md5(f"{func.__module__}:{func.__name__}:{url}".encode()).hexdigest()
+    return f"{FastAPICache.get_prefix()}:{namespace}:{digest}"
+
+class ResponseCoder(Coder):
+    @classmethod
+    def encode(cls, value: Response) -> str:
+        headers = {name: value.headers[name] for name in CACHED_HEADERS if name in value.headers}
+        return orjson.dumps([value.body.decode(), headers]).decode()
+
+    @classmethod
+    def decode(cls, value: str) -> Response:
+        body, headers = orjson.loads(value)
+        return Response(body, media_type="application/json", headers={**headers, CACHE_HIT_HEADER: "true"})
+
+def _stale_key(request: Request) -> str:
+    params = request.query_params
+    query = "&".join(f"{name}={params[name]}" for name in STALE_QUERY_PARAMS if name in params)
+    return f"{STALE_PREFIX}:{request.url.path}?{query}"
+
+def _rebuild_response(body: bytes, status_code: int, headers: list) -> Response:
+    # Keep headers as a list so repeated names survive
+    response = Response(body, status_code=status_code)
+    response.raw_headers = [(b"content-length", str(len(body)).encode())] + [
+        (name.encode("latin-1"), value.encode("latin-1")) for name, value in headers
+    ]
+    return response
+
+def _is_stale_path(path: str) -> bool:
+    return any(path == prefix or path.startswith(prefix + "/") for prefix in STALE_PATHS)
+
+def _stale_needs_write(key: str, digest: str) -> bool:
+    # Rewrite when the body changed or the last write is older than the refresh interval
+    written = _stale_written.get(key)
+    return written is None or written[0] != digest or time.monotonic() - written[1] > STALE_REFRESH_INTERVAL
+
+def _remember_stale_write(key: str, digest: str) -> None:
+    # Existing keys are refreshed in place; only new keys evict the oldest entry
+    if key not in _stale_written and len(_stale_written) >= STALE_TRACKED_KEYS:
+        _stale_written.pop(next(iter(_stale_written)))
+    _stale_written[key] = (digest, time.monotonic())
+
+async def stale_on_error(request: Request, call_next):
+    # Keep the last good GET response per route and page, and replay it when the database is unreachable
+    if redis_client is None or request.method != "GET" or not _is_stale_path(request.url.path):
+        return await call_next(request)
+    from redis.exceptions import RedisError
+    key = _stale_key(request)
+    try:
+        response = await call_next(request)
+    except DBAPIError:
+        try:
+            stale = await redis_client.hgetall(key)
+        except RedisError:
+            stale = None
+        if not stale:
+            raise
+        headers = [tuple(header) for header in orjson.loads(stale[b"headers"])]
+        headers.append(("x-from-stale-cache", "true"))
+        return _rebuild_response(stale[b"body"], int(stale[b"status"]), headers)
+    # Responses served by fastapi-cache never touched the database and are already stored
+    if response.status_code != 200 or CACHE_HIT_HEADER.lower() in response.headers:
+        return response
+    body = b"".join([chunk async for chunk in response.body_iterator])
+    headers = [
+        (name.decode("latin-1"), value.decode("latin-1"))
+        for name, value in response.raw_headers
+        if name != b"content-length"
+    ]
+    digest = hashlib.md5(body).hexdigest()
+    if _stale_needs_write(key, digest):
+        try:
+            async with redis_client.pipeline(transaction=False) as pipe:
+                pipe.hset(key, mapping={
+                    "status": response.status_code,
+                    "headers": orjson.dumps(headers),
+                    "body": body
+                })
+                pipe.expire(key, STALE_TTL)
+                await pipe.execute()
+        except RedisError:
+            pass
+        else:
+            _remember_stale_write(key, digest)
+    return _rebuild_response(body, response.status_code, headers)
@@ -1,16 +1,37 @@
+from contextlib import asynccontextmanager
+import anyio.to_thread
 from fastapi import FastAPI
-from app.database import engine, Base
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.orm import configure_mappers
+from app.cache import init_cache, stale_on_error, REDIS_URL
+from app.responses import ConditionalGetMiddleware
+from app.database import engine, Base, AUTO_CREATE_TABLES, THREADPOOL_SIZE, warm_pool
 from app.routers import students_router, courses_router, enrollments_router, grades_router
 from app import models
 
-Base.metadata.create_all(bind=engine)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+    configure_mappers()
+    init_cache()
+    if AUTO_CREATE_TABLES:
+        Base.metadata.create_all(bind=engine)
+    warm_pool()
+    yield
+    engine.dispose()
 
 app = FastAPI(
     title="Course Enrollment API",
     description="API for managing student course enrollments and grades",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
+app.add_middleware(ConditionalGetMiddleware)
+if REDIS_URL:
+    app.middleware("http")(stale_on_error)
+
 @app.get("/health")
 def health_check():
     return {"status": "healthy", "message": "Course Enrollment API is running"}
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Date, Float, ForeignKey
+from sqlalchemy import Column, Integer, String, Date, Float, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from app.database import Base
 
@@ -9,7 +9,7 @@ class Student(Base):
     name = Column(String, nullable=False)
     email = Column(String, unique=True, nullable=False)
     
-    enrollments = relationship("Enrollment", back_populates="student")
+    enrollments = relationship("Enrollment", back_populates="student", lazy="raise", passive_deletes=True)
 
 class Course(Base):
     __tablename__ = "courses"
@@ -19,26 +19,30 @@ class Course(Base):
     course_code = Column(String, unique=True, nullable=False)
     credits = Column(Integer, nullable=False)
     
-    enrollments = relationship("Enrollment", back_populates="course")
+    enrollments = relationship("Enrollment", back_populates="course", lazy="raise", passive_deletes=True)
 
 class Enrollment(Base):
     __tablename__ = "enrollments"
+    __table_args__ = (
+        Index("ix_enrollments_student_course", "student_id", "course_id", unique=True),
+        Index("ix_enrollments_course", "course_id"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
-    student_id = Column(Integer, ForeignKey("students.id"), nullable=False)
-    course_id = Column(Integer, ForeignKey("courses.id"), nullable=False)
+    student_id = Column(Integer, ForeignKey("students.id", ondelete="CASCADE"), nullable=False)
+    course_id = Column(Integer, ForeignKey("courses.id", ondelete="CASCADE"), nullable=False)
     enrollment_date = Column(Date, nullable=False)
     
-    student = relationship("Student", back_populates="enrollments")
-    course = relationship("Course", back_populates="enrollments")
-    grade = relationship("Grade", back_populates="enrollment", uselist=False)
+    student = relationship("Student", back_populates="enrollments", lazy="raise")
+    course = relationship("Course", back_populates="enrollments", lazy="raise")
+    grade = relationship("Grade", back_populates="enrollment", lazy="raise", uselist=False, passive_deletes=True)
 
 class Grade(Base):
     __tablename__ = "grades"
     
     id = Column(Integer, primary_key=True, index=True)
-    enrollment_id = Column(Integer, ForeignKey("enrollments.id"), nullable=False)
+    enrollment_id = Column(Integer, ForeignKey("enrollments.id", ondelete="CASCADE"), unique=True, nullable=False)
     marks = Column(Float, nullable=False)
     final_grade = Column(String, nullable=True)
     
-    enrollment = relationship("Enrollment", back_populates="grade")
+    enrollment = relationship("Enrollment", back_populates="grade", lazy="raise")
@@ -1,37 +1,48 @@
+from sqlalchemy import select, insert, update, delete, bindparam
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
+from typing import List, Optional
 from app.models import Course
 from app.schemas import CourseCreate
 
+_COURSE_COLUMNS = (Course.id, Course.course_name, Course.course_code, Course.credits)
+
+_LIST_ROWS = select(*_COURSE_COLUMNS).order_by(Course.id).offset(bindparam("skip")).limit(bindparam("limit"))
+_LIST_ROWS_AFTER = select(*_COURSE_COLUMNS).where(Course.id > bindparam("after_id")).order_by(Course.id).limit(bindparam("limit"))
+_DELETE = delete(Course).where(Course.id == bindparam("course_id"))
+
 def create_course(db: Session, course: CourseCreate):
-    db_course = Course(**course.model_dump())
-    db.add(db_course)
+    stmt = (
+        pg_insert(Course)
+        .values(**course.model_dump())
+        .on_conflict_do_nothing(index_elements=["course_code"])
+        .returning(Course)
+    )
+    db_course = db.execute(stmt).scalar_one_or_none()
     db.commit()
-    db.refresh(db_course)
     return db_course
 
-def get_all_courses(db: Session, skip: int = 0, limit: int = 100):
-    return db.query(Course).offset(skip).limit(limit).all()
+def bulk_create_courses(db: Session, courses: List[CourseCreate]):
+    result = db.execute(insert(Course).returning(Course.id), [course.model_dump() for course in courses])
+    ids = result.scalars().all()
+    db.commit()
+    return ids
 
-def get_course_by_id(db: Session, course_id: int):
-    return db.query(Course).filter(Course.id == course_id).first()
+def list_courses_rows(db: Session, skip: int = 0, limit: int = 100, after_id: Optional[int] = None):
+    if after_id is not None:
+        return db.execute(_LIST_ROWS_AFTER, {"after_id": after_id, "limit": limit}).all()
+    return db.execute(_LIST_ROWS, {"skip": skip, "limit": limit}).all()
 
-def get_course_by_code(db: Session, course_code: str):
-    return db.query(Course).filter(Course.course_code == course_code).first()
+def get_course_by_id(db: Session, course_id: int):
+    return db.get(Course, course_id)
 
 def update_course(db: Session, course_id: int, course: CourseCreate):
-    db_course = db.query(Course).filter(Course.id == course_id).first()
-    if db_course:
-        db_course.course_name = course.course_name
-        db_course.course_code = course.course_code
-        db_course.credits = course.credits
-        db.commit()
-        db.refresh(db_course)
+    stmt = update(Course).where(Course.id == course_id).values(**course.model_dump()).returning(Course)
+    db_course = db.execute(stmt).scalar_one_or_none()
+    db.commit()
     return db_course
 
 def delete_course(db: Session, course_id: int):
-    db_course = db.query(Course).filter(Course.id == course_id).first()
-    if db_course:
-        db.delete(db_course)
-        db.commit()
-        return True
-    return False
+    result = db.execute(_DELETE, {"course_id": course_id})
+    db.commit()
+    return result.rowcount > 0
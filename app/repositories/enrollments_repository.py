@@ -1,36 +1,84 @@
+from sqlalchemy import select, insert, delete, bindparam, exists
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
-from app.models import Enrollment
+from typing import List, Optional
+from app.models import Enrollment, Student, Course
 from app.schemas import EnrollmentCreate
 
+_ENROLLMENT_COLUMNS = (Enrollment.id, Enrollment.student_id, Enrollment.course_id, Enrollment.enrollment_date)
+
+_LIST_ROWS = select(*_ENROLLMENT_COLUMNS).order_by(Enrollment.id).offset(bindparam("skip")).limit(bindparam("limit"))
+_LIST_ROWS_AFTER = select(*_ENROLLMENT_COLUMNS).where(Enrollment.id > bindparam("after_id")).order_by(Enrollment.id).limit(bindparam("limit"))
+# Parent-first outer joins: no rows means the parent is missing, a NULL enrollment id means it has none
+_GET_BY_STUDENT = (
+    select(Student.id.label("parent_id"), *_ENROLLMENT_COLUMNS, Course.course_name, Course.course_code)
+    .select_from(Student)
+    .outerjoin(Enrollment, Enrollment.student_id == Student.id)
+    .outerjoin(Course, Course.id == Enrollment.course_id)
+    .where(Student.id == bindparam("student_id"))
+    .order_by(Course.course_name, Enrollment.id)
+)
+_GET_BY_COURSE = (
+    select(
+        Course.id.label("parent_id"),
+        *_ENROLLMENT_COLUMNS,
+        Student.name.label("student_name"),
+        Student.email.label("student_email")
+    )
+    .select_from(Course)
+    .outerjoin(Enrollment, Enrollment.course_id == Course.id)
+    .outerjoin(Student, Student.id == Enrollment.student_id)
+    .where(Course.id == bindparam("course_id"))
+    .order_by(Student.name, Enrollment.id)
+)
+_DELETE = delete(Enrollment).where(Enrollment.id == bindparam("enrollment_id"))
+_STUDENT_AND_COURSE_EXIST = select(
+    exists().where(Student.id == bindparam("student_id")),
+    exists().where(Course.id == bindparam("course_id"))
+)
+
 def create_enrollment(db: Session, enrollment: EnrollmentCreate):
-    db_enrollment = Enrollment(**enrollment.model_dump())
-    db.add(db_enrollment)
+    stmt = (
+        pg_insert(Enrollment)
+        .values(**enrollment.model_dump())
+        .on_conflict_do_nothing(index_elements=["student_id", "course_id"])
+        .returning(Enrollment)
+    )
+    db_enrollment = db.execute(stmt).scalar_one_or_none()
     db.commit()
-    db.refresh(db_enrollment)
     return db_enrollment
 
-def get_all_enrollments(db: Session, skip: int = 0, limit: int = 100):
-    return db.query(Enrollment).offset(skip).limit(limit).all()
+def bulk_create_enrollments(db: Session, enrollments: List[EnrollmentCreate]):
+    stmt = insert(Enrollment).returning(*_ENROLLMENT_COLUMNS, sort_by_parameter_order=True)
+    rows = db.execute(stmt, [enrollment.model_dump() for enrollment in enrollments]).all()
+    db.commit()
+    return rows
+
+def list_enrollments_rows(db: Session, skip: int = 0, limit: int = 100, after_id: Optional[int] = None):
+    if after_id is not None:
+        return db.execute(_LIST_ROWS_AFTER, {"after_id": after_id, "limit": limit}).all()
+    return db.execute(_LIST_ROWS, {"skip": skip, "limit": limit}).all()
 
 def get_enrollment_by_id(db: Session, enrollment_id: int):
-    return db.query(Enrollment).filter(Enrollment.id == enrollment_id).first()
+    return db.get(Enrollment, enrollment_id)
+
+def student_and_course_exist(db: Session, student_id: int, course_id: int):
+    params = {"student_id": student_id, "course_id": course_id}
+    student_exists, course_exists = db.execute(_STUDENT_AND_COURSE_EXIST, params).one()
+    return student_exists, course_exists
 
-def get_enrollment_by_student_and_course(db: Session, student_id: int, course_id: int):
-    return db.query(Enrollment).filter(
-        Enrollment.student_id == student_id,
-        Enrollment.course_id == course_id
-    ).first()
+def _enrollments_or_none(rows):
+    if not rows:
+        return None
+    return [row for row in rows if row.id is not None]
 
 def get_enrollments_by_student(db: Session, student_id: int):
-    return db.query(Enrollment).filter(Enrollment.student_id == student_id).all()
+    return _enrollments_or_none(db.execute(_GET_BY_STUDENT, {"student_id": student_id}).all())
 
 def get_enrollments_by_course(db: Session, course_id: int):
-    return db.query(Enrollment).filter(Enrollment.course_id == course_id).all()
+    return _enrollments_or_none(db.execute(_GET_BY_COURSE, {"course_id": course_id}).all())
 
 def delete_enrollment(db: Session, enrollment_id: int):
-    db_enrollment = db.query(Enrollment).filter(Enrollment.id == enrollment_id).first()
-    if db_enrollment:
-        db.delete(db_enrollment)
-        db.commit()
-        return True
-    return False
+    result = db.execute(_DELETE, {"enrollment_id": enrollment_id})
+    db.commit()
+    return result.rowcount > 0
@@ -1,36 +1,55 @@
+from sqlalchemy import select, insert, update, delete, bindparam
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
+from typing import List, Optional
 from app.models import Grade
 from app.schemas import GradeCreate
 
-def create_grade(db: Session, grade: GradeCreate):
-    db_grade = Grade(**grade.model_dump())
-    db.add(db_grade)
+_GRADE_COLUMNS = (Grade.id, Grade.enrollment_id, Grade.marks, Grade.final_grade)
+
+_LIST_ROWS = select(*_GRADE_COLUMNS).order_by(Grade.id).offset(bindparam("skip")).limit(bindparam("limit"))
+_LIST_ROWS_AFTER = select(*_GRADE_COLUMNS).where(Grade.id > bindparam("after_id")).order_by(Grade.id).limit(bindparam("limit"))
+_GET_BY_ENROLLMENT = select(Grade).where(Grade.enrollment_id == bindparam("enrollment_id"))
+_DELETE = delete(Grade).where(Grade.id == bindparam("grade_id"))
+_BULK_INSERT = pg_insert(Grade).on_conflict_do_nothing(index_elements=["enrollment_id"]).returning(*_GRADE_COLUMNS)
+
+def create_grade(db: Session, grade: GradeCreate, final_grade: str):
+    stmt = (
+        insert(Grade)
+        .values(enrollment_id=grade.enrollment_id, marks=grade.marks, final_grade=final_grade)
+        .returning(Grade)
+    )
+    db_grade = db.execute(stmt).scalar_one()
     db.commit()
-    db.refresh(db_grade)
     return db_grade
 
-def get_all_grades(db: Session, skip: int = 0, limit: int = 100):
-    return db.query(Grade).offset(skip).limit(limit).all()
+def bulk_create_grades(db: Session, grades: List[GradeCreate], final_grades: List[str]):
+    rows = [
+        {"enrollment_id": grade.enrollment_id, "marks": grade.marks, "final_grade": final_grade}
+        for grade, final_grade in zip(grades, final_grades)
+    ]
+    created = db.execute(_BULK_INSERT, rows).all()
+    db.commit()
+    return created
+
+def list_grades_rows(db: Session, skip: int = 0, limit: int = 100, after_id: Optional[int] = None):
+    if after_id is not None:
+        return db.execute(_LIST_ROWS_AFTER, {"after_id": after_id, "limit": limit}).all()
+    return db.execute(_LIST_ROWS, {"skip": skip, "limit": limit}).all()
 
 def get_grade_by_id(db: Session, grade_id: int):
-    return db.query(Grade).filter(Grade.id == grade_id).first()
+    return db.get(Grade, grade_id)
 
 def get_grade_by_enrollment(db: Session, enrollment_id: int):
-    return db.query(Grade).filter(Grade.enrollment_id == enrollment_id).first()
+    return db.execute(_GET_BY_ENROLLMENT, {"enrollment_id": enrollment_id}).scalars().first()
 
 def update_grade(db: Session, grade_id: int, marks: float, final_grade: str):
-    db_grade = db.query(Grade).filter(Grade.id == grade_id).first()
-    if db_grade:
-        db_grade.marks = marks
-        db_grade.final_grade = final_grade
-        db.commit()
-        db.refresh(db_grade)
+    stmt = update(Grade).where(Grade.id == grade_id).values(marks=marks, final_grade=final_grade).returning(Grade)
+    db_grade = db.execute(stmt).scalar_one_or_none()
+    db.commit()
     return db_grade
 
 def delete_grade(db: Session, grade_id: int):
-    db_grade = db.query(Grade).filter(Grade.id == grade_id).first()
-    if db_grade:
-        db.delete(db_grade)
-        db.commit()
-        return True
-    return False
+    result = db.execute(_DELETE, {"grade_id": grade_id})
+    db.commit()
+    return result.rowcount > 0
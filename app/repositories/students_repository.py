@@ -1,36 +1,48 @@
+from sqlalchemy import select, insert, update, delete, bindparam
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
+from typing import List, Optional
 from app.models import Student
 from app.schemas import StudentCreate
 
+_STUDENT_COLUMNS = (Student.id, Student.name, Student.email)
+
+_LIST_ROWS = select(*_STUDENT_COLUMNS).order_by(Student.id).offset(bindparam("skip")).limit(bindparam("limit"))
+_LIST_ROWS_AFTER = select(*_STUDENT_COLUMNS).where(Student.id > bindparam("after_id")).order_by(Student.id).limit(bindparam("limit"))
+_DELETE = delete(Student).where(Student.id == bindparam("student_id"))
+
 def create_student(db: Session, student: StudentCreate):
-    db_student = Student(**student.model_dump())
-    db.add(db_student)
+    stmt = (
+        pg_insert(Student)
+        .values(**student.model_dump())
+        .on_conflict_do_nothing(index_elements=["email"])
+        .returning(Student)
+    )
+    db_student = db.execute(stmt).scalar_one_or_none()
     db.commit()
-    db.refresh(db_student)
     return db_student
 
-def get_all_students(db: Session, skip: int = 0, limit: int = 100):
-    return db.query(Student).offset(skip).limit(limit).all()
+def bulk_create_students(db: Session, students: List[StudentCreate]):
+    result = db.execute(insert(Student).returning(Student.id), [student.model_dump() for student in students])
+    ids = result.scalars().all()
+    db.commit()
+    return ids
 
-def get_student_by_id(db: Session, student_id: int):
-    return db.query(Student).filter(Student.id == student_id).first()
+def list_students_rows(db: Session, skip: int = 0, limit: int = 100, after_id: Optional[int] = None):
+    if after_id is not None:
+        return db.execute(_LIST_ROWS_AFTER, {"after_id": after_id, "limit": limit}).all()
+    return db.execute(_LIST_ROWS, {"skip": skip, "limit": limit}).all()
 
-def get_student_by_email(db: Session, email: str):
-    return db.query(Student).filter(Student.email == email).first()
+def get_student_by_id(db: Session, student_id: int):
+    return db.get(Student, student_id)
 
 def update_student(db: Session, student_id: int, student: StudentCreate):
-    db_student = db.query(Student).filter(Student.id == student_id).first()
-    if db_student:
-        db_student.name = student.name
-        db_student.email = student.email
-        db.commit()
-        db.refresh(db_student)
+    stmt = update(Student).where(Student.id == student_id).values(**student.model_dump()).returning(Student)
+    db_student = db.execute(stmt).scalar_one_or_none()
+    db.commit()
     return db_student
 
 def delete_student(db: Session, student_id: int):
-    db_student = db.query(Student).filter(Student.id == student_id).first()
-    if db_student:
-        db.delete(db_student)
-        db.commit()
-        return True
-    return False
+    result = db.execute(_DELETE, {"student_id": student_id})
+    db.commit()
+    return result.rowcount > 0
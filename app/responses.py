@@ -0,0 +1,60 @@
+import hashlib
+from typing import Any, Optional
+from fastapi import Response
+from pydantic import TypeAdapter
+from starlette.datastructures import Headers
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+def cursor_headers(rows: Any, limit: int) -> Optional[dict]:
+    # A full page means there may be more rows after the last id
+    if rows and len(rows) == limit:
+        return {NEXT_CURSOR_HEADER: str(rows[-1].id)}
+    return None
+
+def json_response(
+    adapter: TypeAdapter,
+    value: Any,
+    headers: Optional[dict] = None,
+    status_code: int = 200,
+    etag: bool = False
+) -> Response:
+    data = adapter.validate_python(value)
+    body = adapter.dump_json(data)
+    if etag:
+        headers = {**(headers or {}), "ETag": f'W/"{hashlib.md5(body).hexdigest()}"'}
+    return Response(body, status_code=status_code, media_type="application/json", headers=headers)
+
+def _opaque_tag(tag: str) -> str:
+    # Weak comparison (RFC 9110 8.8.3.2) ignores the W/ prefix
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
+
+class ConditionalGetMiddleware:
+    # Turns a 200 GET response into a bodiless 304 when its ETag matches If-None-Match
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] != "GET":
+            return await self.app(scope, receive, send)
+        if_none_match = Headers(scope=scope).get("if-none-match")
+        if not if_none_match:
+            return await self.app(scope, receive, send)
+        candidates = {_opaque_tag(tag) for tag in if_none_match.split(",")}
+        not_modified = False
+
+        async def send_wrapper(message):
+            nonlocal not_modified
+            if message["type"] == "http.response.start":
+                etag = Headers(raw=message["headers"]).get("etag")
+                if message["status"] == 200 and etag and ("*" in candidates or _opaque_tag(etag) in candidates):
+                    not_modified = True
+                    message = {"type": message["type"], "status": 304, "headers": [(b"etag", etag.encode())]}
+                await send(message)
+            elif not not_modified:
+                await send(message)
+            elif not message.get("more_body", False):
+                await send({"type": "http.response.body", "body": b""})
+
+        await self.app(scope, receive, send_wrapper)
@@ -1,28 +1,49 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
-from typing import List
-from app.database import get_db
+from typing import List, Optional
+from fastapi_cache.decorator import cache
+from pydantic import TypeAdapter
+from app.cache import ResponseCoder, invalidate, request_key_builder
+from app.responses import cursor_headers, json_response
+from app.database import get_db, get_readonly_db
 from app.schemas import CourseCreate, CourseResponse
 from app.services import courses_service as course_service
 
 router = APIRouter()
 
+_COURSE = TypeAdapter(CourseResponse)
+_COURSE_LIST = TypeAdapter(List[CourseResponse])
+
 @router.post("/", response_model=CourseResponse, status_code=201)
 def create_course(course: CourseCreate, db: Session = Depends(get_db)):
-    return course_service.create_course(db, course)
+    created = course_service.create_course(db, course)
+    invalidate("courses")
+    return created
 
 @router.get("/", response_model=List[CourseResponse])
-def get_all_courses(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    return course_service.get_all_courses(db, skip, limit)
+@cache(expire=300, namespace="courses", coder=ResponseCoder, key_builder=request_key_builder)
+def get_all_courses(
+    skip: int = 0,
+    limit: int = 100,
+    after_id: Optional[int] = None,
+    db: Session = Depends(get_readonly_db)
+):
+    courses = course_service.get_all_courses(db, skip, limit, after_id)
+    return json_response(_COURSE_LIST, courses, cursor_headers(courses, limit))
 
 @router.get("/{course_id}", response_model=CourseResponse)
-def get_course(course_id: int, db: Session = Depends(get_db)):
-    return course_service.get_course_by_id(db, course_id)
+@cache(expire=300, namespace="courses", coder=ResponseCoder, key_builder=request_key_builder)
+def get_course(course_id: int, db: Session = Depends(get_readonly_db)):
+    return json_response(_COURSE, course_service.get_course_by_id(db, course_id), etag=True)
 
 @router.put("/{course_id}", response_model=CourseResponse)
 def update_course(course_id: int, course: CourseCreate, db: Session = Depends(get_db)):
-    return course_service.update_course(db, course_id, course)
+    updated = course_service.update_course(db, course_id, course)
+    invalidate("courses")
+    return updated
 
 @router.delete("/{course_id}")
 def delete_course(course_id: int, db: Session = Depends(get_db)):
-    return course_service.delete_course(db, course_id)
+    result = course_service.delete_course(db, course_id)
+    invalidate("courses", "enrollments")
+    return result
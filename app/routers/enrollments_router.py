@@ -1,32 +1,57 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
-from typing import List
-from app.database import get_db
-from app.schemas import EnrollmentCreate, EnrollmentResponse
+from typing import List, Optional
+from fastapi_cache.decorator import cache
+from pydantic import TypeAdapter
+from app.cache import ResponseCoder, invalidate, request_key_builder
+from app.responses import cursor_headers, json_response
+from app.database import get_db, get_readonly_db
+from app.schemas import EnrollmentCreate, EnrollmentResponse, CourseRosterEntry, StudentEnrollmentEntry
 from app.services import enrollments_service as enrollment_service
 
 router = APIRouter()
 
+_ENROLLMENT_LIST = TypeAdapter(List[EnrollmentResponse])
+_STUDENT_ENROLLMENTS = TypeAdapter(List[StudentEnrollmentEntry])
+_COURSE_ROSTER = TypeAdapter(List[CourseRosterEntry])
+
 @router.post("/", response_model=EnrollmentResponse, status_code=201)
 def create_enrollment(enrollment: EnrollmentCreate, db: Session = Depends(get_db)):
-    return enrollment_service.create_enrollment(db, enrollment)
+    created = enrollment_service.create_enrollment(db, enrollment)
+    invalidate("enrollments")
+    return created
+
+@router.post("/bulk", response_model=List[EnrollmentResponse], status_code=201)
+def create_enrollments_bulk(enrollments: List[EnrollmentCreate], db: Session = Depends(get_db)):
+    created = enrollment_service.create_enrollments_bulk(db, enrollments)
+    invalidate("enrollments")
+    return json_response(_ENROLLMENT_LIST, created, status_code=201)
 
 @router.get("/", response_model=List[EnrollmentResponse])
-def get_all_enrollments(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    return enrollment_service.get_all_enrollments(db, skip, limit)
+def get_all_enrollments(
+    skip: int = 0,
+    limit: int = 100,
+    after_id: Optional[int] = None,
+    db: Session = Depends(get_readonly_db)
+):
+    enrollments = enrollment_service.get_all_enrollments(db, skip, limit, after_id)
+    return json_response(_ENROLLMENT_LIST, enrollments, cursor_headers(enrollments, limit))
 
 @router.get("/{enrollment_id}", response_model=EnrollmentResponse)
-def get_enrollment(enrollment_id: int, db: Session = Depends(get_db)):
+def get_enrollment(enrollment_id: int, db: Session = Depends(get_readonly_db)):
     return enrollment_service.get_enrollment_by_id(db, enrollment_id)
 
-@router.get("/student/{student_id}", response_model=List[EnrollmentResponse])
-def get_enrollments_by_student(student_id: int, db: Session = Depends(get_db)):
-    return enrollment_service.get_enrollments_by_student(db, student_id)
+@router.get("/student/{student_id}", response_model=List[StudentEnrollmentEntry])
+def get_enrollments_by_student(student_id: int, db: Session = Depends(get_readonly_db)):
+    return json_response(_STUDENT_ENROLLMENTS, enrollment_service.get_enrollments_by_student(db, student_id))
 
-@router.get("/course/{course_id}", response_model=List[EnrollmentResponse])
-def get_enrollments_by_course(course_id: int, db: Session = Depends(get_db)):
-    return enrollment_service.get_enrollments_by_course(db, course_id)
+@router.get("/course/{course_id}", response_model=List[CourseRosterEntry])
+@cache(expire=60, namespace="enrollments", coder=ResponseCoder, key_builder=request_key_builder)
+def get_enrollments_by_course(course_id: int, db: Session = Depends(get_readonly_db)):
+    return json_response(_COURSE_ROSTER, enrollment_service.get_enrollments_by_course(db, course_id))
 
 @router.delete("/{enrollment_id}")
 def delete_enrollment(enrollment_id: int, db: Session = Depends(get_db)):
-    return enrollment_service.delete_enrollment(db, enrollment_id)
+    result = enrollment_service.delete_enrollment(db, enrollment_id)
+    invalidate("enrollments")
+    return result
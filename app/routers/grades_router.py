@@ -1,30 +1,43 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
-from typing import List
-from app.database import get_db
+from typing import List, Optional
+from app.responses import cursor_headers, json_response
+from app.database import get_db, get_readonly_db
 from app.schemas import GradeCreate, GradeResponse
 from app.services import grades_service as grade_service
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, TypeAdapter
 
 router = APIRouter()
 
+_GRADE_LIST = TypeAdapter(List[GradeResponse])
+
 class GradeUpdate(BaseModel):
-    marks: float
+    marks: float = Field(ge=0, le=100)
 
 @router.post("/", response_model=GradeResponse, status_code=201)
 def create_grade(grade: GradeCreate, db: Session = Depends(get_db)):
     return grade_service.create_grade(db, grade)
 
+@router.post("/bulk", response_model=List[GradeResponse], status_code=201)
+def create_grades_bulk(grades: List[GradeCreate], db: Session = Depends(get_db)):
+    return json_response(_GRADE_LIST, grade_service.create_grades_bulk(db, grades), status_code=201)
+
 @router.get("/", response_model=List[GradeResponse])
-def get_all_grades(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    return grade_service.get_all_grades(db, skip, limit)
+def get_all_grades(
+    skip: int = 0,
+    limit: int = 100,
+    after_id: Optional[int] = None,
+    db: Session = Depends(get_readonly_db)
+):
+    grades = grade_service.get_all_grades(db, skip, limit, after_id)
+    return json_response(_GRADE_LIST, grades, cursor_headers(grades, limit))
 
 @router.get("/{grade_id}", response_model=GradeResponse)
-def get_grade(grade_id: int, db: Session = Depends(get_db)):
+def get_grade(grade_id: int, db: Session = Depends(get_readonly_db)):
     return grade_service.get_grade_by_id(db, grade_id)
 
 @router.get("/enrollment/{enrollment_id}", response_model=GradeResponse)
-def get_grade_by_enrollment(enrollment_id: int, db: Session = Depends(get_db)):
+def get_grade_by_enrollment(enrollment_id: int, db: Session = Depends(get_readonly_db)):
     return grade_service.get_grade_by_enrollment(db, enrollment_id)
 
 @router.put("/{grade_id}", response_model=GradeResponse)
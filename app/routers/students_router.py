@@ -1,28 +1,48 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
-from typing import List
-from app.database import get_db
+from typing import List, Optional
+from fastapi_cache.decorator import cache
+from pydantic import TypeAdapter
+from app.cache import ResponseCoder, invalidate, request_key_builder
+from app.responses import cursor_headers, json_response
+from app.database import get_db, get_readonly_db
 from app.schemas import StudentCreate, StudentResponse
 from app.services import students_service as student_service
 
 router = APIRouter()
 
+_STUDENT = TypeAdapter(StudentResponse)
+_STUDENT_LIST = TypeAdapter(List[StudentResponse])
+
 @router.post("/", response_model=StudentResponse, status_code=201)
 def create_student(student: StudentCreate, db: Session = Depends(get_db)):
-    return student_service.create_student(db, student)
+    created = student_service.create_student(db, student)
+    invalidate("students")
+    return created
 
 @router.get("/", response_model=List[StudentResponse])
-def get_all_students(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    return student_service.get_all_students(db, skip, limit)
+@cache(expire=60, namespace="students", coder=ResponseCoder, key_builder=request_key_builder)
+def get_all_students(
+    skip: int = 0,
+    limit: int = 100,
+    after_id: Optional[int] = None,
+    db: Session = Depends(get_readonly_db)
+):
+    students = student_service.get_all_students(db, skip, limit, after_id)
+    return json_response(_STUDENT_LIST, students, cursor_headers(students, limit))
 
 @router.get("/{student_id}", response_model=StudentResponse)
-def get_student(student_id: int, db: Session = Depends(get_db)):
-    return student_service.get_student_by_id(db, student_id)
+def get_student(student_id: int, db: Session = Depends(get_readonly_db)):
+    return json_response(_STUDENT, student_service.get_student_by_id(db, student_id), etag=True)
 
 @router.put("/{student_id}", response_model=StudentResponse)
 def update_student(student_id: int, student: StudentCreate, db: Session = Depends(get_db)):
-    return student_service.update_student(db, student_id, student)
+    updated = student_service.update_student(db, student_id, student)
+    invalidate("students", "enrollments")
+    return updated
 
 @router.delete("/{student_id}")
 def delete_student(student_id: int, db: Session = Depends(get_db)):
-    return student_service.delete_student(db, student_id)
+    result = student_service.delete_student(db, student_id)
+    invalidate("students", "enrollments")
+    return result
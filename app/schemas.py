@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import date
 from typing import Optional
 
@@ -11,9 +11,8 @@ class StudentCreate(StudentBase):
 
 class StudentResponse(StudentBase):
     id: int
-    
-    class Config:
-        from_attributes = True
+
+    model_config = ConfigDict(from_attributes=True)
 
 # Course schemas
 class CourseBase(BaseModel):
@@ -26,9 +25,8 @@ class CourseCreate(CourseBase):
 
 class CourseResponse(CourseBase):
     id: int
-    
-    class Config:
-        from_attributes = True
+
+    model_config = ConfigDict(from_attributes=True)
 
 # Enrollment schemas
 class EnrollmentBase(BaseModel):
@@ -41,20 +39,26 @@ class EnrollmentCreate(EnrollmentBase):
 
 class EnrollmentResponse(EnrollmentBase):
     id: int
-    
-    class Config:
-        from_attributes = True
+
+    model_config = ConfigDict(from_attributes=True)
+
+class CourseRosterEntry(EnrollmentResponse):
+    student_name: str
+    student_email: str
+
+class StudentEnrollmentEntry(EnrollmentResponse):
+    course_name: str
+    course_code: str
 
 # Grade schemas
 class GradeCreate(BaseModel):
     enrollment_id: int
-    marks: float
+    marks: float = Field(ge=0, le=100)
 
 class GradeResponse(BaseModel):
     id: int
     enrollment_id: int
     marks: float
     final_grade: Optional[str] = None
-    
-    class Config:
-        from_attributes = True
+
+    model_config = ConfigDict(from_attributes=True)
@@ -1,16 +1,18 @@
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
+from typing import Optional
 from app.schemas import CourseCreate
 from app.repositories import courses_repository as course_repo
 from fastapi import HTTPException
 
 def create_course(db: Session, course: CourseCreate):
-    existing_course = course_repo.get_course_by_code(db, course.course_code)
-    if existing_course:
+    db_course = course_repo.create_course(db, course)
+    if not db_course:
         raise HTTPException(status_code=400, detail="Course code already exists")
-    return course_repo.create_course(db, course)
+    return db_course
 
-def get_all_courses(db: Session, skip: int = 0, limit: int = 100):
-    return course_repo.get_all_courses(db, skip, limit)
+def get_all_courses(db: Session, skip: int = 0, limit: int = 100, after_id: Optional[int] = None):
+    return course_repo.list_courses_rows(db, skip, limit, after_id)
 
 def get_course_by_id(db: Session, course_id: int):
     course = course_repo.get_course_by_id(db, course_id)
@@ -19,22 +21,18 @@ def get_course_by_id(db: Session, course_id: int):
     return course
 
 def update_course(db: Session, course_id: int, course: CourseCreate):
-    existing_course = course_repo.get_course_by_id(db, course_id)
-    if not existing_course:
-        raise HTTPException(status_code=404, detail="Course not found")
-    
-    code_check = course_repo.get_course_by_code(db, course.course_code)
-    if code_check and code_check.id != course_id:
+    try:
+        db_course = course_repo.update_course(db, course_id, course)
+    except IntegrityError:
+        db.rollback()
         raise HTTPException(status_code=400, detail="Course code already exists")
     
-    return course_repo.update_course(db, course_id, course)
+    if not db_course:
+        raise HTTPException(status_code=404, detail="Course not found")
+    return db_course
 
 def delete_course(db: Session, course_id: int):
-    course = course_repo.get_course_by_id(db, course_id)
-    if not course:
-        raise HTTPException(status_code=404, detail="Course not found")
-    
     success = course_repo.delete_course(db, course_id)
     if not success:
-        raise HTTPException(status_code=500, detail="Failed to delete course")
+        raise HTTPException(status_code=404, detail="Course not found")
     return {"message": "Course deleted successfully"}
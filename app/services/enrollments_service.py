@@ -1,32 +1,45 @@
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
+from typing import List, Optional
 from app.schemas import EnrollmentCreate
 from app.repositories import enrollments_repository as enrollment_repo
-from app.repositories import students_repository as student_repo
-from app.repositories import courses_repository as course_repo
 from fastapi import HTTPException
 
 def create_enrollment(db: Session, enrollment: EnrollmentCreate):
-    student = student_repo.get_student_by_id(db, enrollment.student_id)
-    if not student:
-        raise HTTPException(status_code=404, detail="Student not found")
-    
-    course = course_repo.get_course_by_id(db, enrollment.course_id)
-    if not course:
-        raise HTTPException(status_code=404, detail="Course not found")
-    
-    existing_enrollment = enrollment_repo.get_enrollment_by_student_and_course(
-        db, enrollment.student_id, enrollment.course_id
-    )
-    if existing_enrollment:
+    try:
+        db_enrollment = enrollment_repo.create_enrollment(db, enrollment)
+    except IntegrityError:
+        # A foreign key failed; find out which side is missing
+        db.rollback()
+        student_exists, course_exists = enrollment_repo.student_and_course_exist(
+            db, enrollment.student_id, enrollment.course_id
+        )
+        if not student_exists:
+            raise HTTPException(status_code=404, detail="Student not found")
+        if not course_exists:
+            raise HTTPException(status_code=404, detail="Course not found")
+        raise
+    if not db_enrollment:
         raise HTTPException(
             status_code=400, 
             detail="Student is already enrolled in this course"
         )
-    
-    return enrollment_repo.create_enrollment(db, enrollment)
+    return db_enrollment
+
+def create_enrollments_bulk(db: Session, enrollments: List[EnrollmentCreate]):
+    if not enrollments:
+        return []
+    try:
+        return enrollment_repo.bulk_create_enrollments(db, enrollments)
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(
+            status_code=400,
+            detail="Batch contains an unknown student or course, or a duplicate enrollment"
+        )
 
-def get_all_enrollments(db: Session, skip: int = 0, limit: int = 100):
-    return enrollment_repo.get_all_enrollments(db, skip, limit)
+def get_all_enrollments(db: Session, skip: int = 0, limit: int = 100, after_id: Optional[int] = None):
+    return enrollment_repo.list_enrollments_rows(db, skip, limit, after_id)
 
 def get_enrollment_by_id(db: Session, enrollment_id: int):
     enrollment = enrollment_repo.get_enrollment_by_id(db, enrollment_id)
@@ -35,23 +48,19 @@ def get_enrollment_by_id(db: Session, enrollment_id: int):
     return enrollment
 
 def get_enrollments_by_student(db: Session, student_id: int):
-    student = student_repo.get_student_by_id(db, student_id)
-    if not student:
+    enrollments = enrollment_repo.get_enrollments_by_student(db, student_id)
+    if enrollments is None:
         raise HTTPException(status_code=404, detail="Student not found")
-    return enrollment_repo.get_enrollments_by_student(db, student_id)
+    return enrollments
 
 def get_enrollments_by_course(db: Session, course_id: int):
-    course = course_repo.get_course_by_id(db, course_id)
-    if not course:
+    enrollments = enrollment_repo.get_enrollments_by_course(db, course_id)
+    if enrollments is None:
         raise HTTPException(status_code=404, detail="Course not found")
-    return enrollment_repo.get_enrollments_by_course(db, course_id)
+    return enrollments
 
 def delete_enrollment(db: Session, enrollment_id: int):
-    enrollment = enrollment_repo.get_enrollment_by_id(db, enrollment_id)
-    if not enrollment:
-        raise HTTPException(status_code=404, detail="Enrollment not found")
-    
     success = enrollment_repo.delete_enrollment(db, enrollment_id)
     if not success:
-        raise HTTPException(status_code=500, detail="Failed to delete enrollment")
+        raise HTTPException(status_code=404, detail="Enrollment not found")
     return {"message": "Enrollment deleted successfully"}
@@ -1,25 +1,18 @@
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
+from typing import List, Optional
 from app.schemas import GradeCreate
 from app.repositories import grades_repository as grade_repo
 from app.repositories import enrollments_repository as enrollment_repo
 from fastapi import HTTPException
 
+# Letter grade per band of 10 marks; the schemas restrict marks to 0-100
+_GRADE_LUT = ("F", "F", "F", "F", "F", "F", "D", "C", "B", "A", "A")
+
 def calculate_final_grade(marks: float) -> str:
-    if marks >= 90:
-        return "A"
-    elif marks >= 80:
-        return "B"
-    elif marks >= 70:
-        return "C"
-    elif marks >= 60:
-        return "D"
-    else:
-        return "F"
+    return _GRADE_LUT[min(int(marks) // 10, 10)]
 
 def create_grade(db: Session, grade: GradeCreate):
-    if grade.marks < 0 or grade.marks > 100:
-        raise HTTPException(status_code=400, detail="Marks must be between 0 and 100")
-    
     enrollment = enrollment_repo.get_enrollment_by_id(db, grade.enrollment_id)
     if not enrollment:
         raise HTTPException(status_code=404, detail="Enrollment not found")
@@ -33,20 +26,21 @@ def create_grade(db: Session, grade: GradeCreate):
     
     final_grade = calculate_final_grade(grade.marks)
     
-    from app.models import Grade
-    db_grade = Grade(
-        enrollment_id=grade.enrollment_id,
-        marks=grade.marks,
-        final_grade=final_grade
-    )
-    db.add(db_grade)
-    db.commit()
-    db.refresh(db_grade)
+    return grade_repo.create_grade(db, grade, final_grade)
+
+def create_grades_bulk(db: Session, grades: List[GradeCreate]):
+    if not grades:
+        return []
     
-    return db_grade
+    final_grades = [calculate_final_grade(grade.marks) for grade in grades]
+    try:
+        return grade_repo.bulk_create_grades(db, grades, final_grades)
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(status_code=404, detail="Enrollment not found")
 
-def get_all_grades(db: Session, skip: int = 0, limit: int = 100):
-    return grade_repo.get_all_grades(db, skip, limit)
+def get_all_grades(db: Session, skip: int = 0, limit: int = 100, after_id: Optional[int] = None):
+    return grade_repo.list_grades_rows(db, skip, limit, after_id)
 
 def get_grade_by_id(db: Session, grade_id: int):
     grade = grade_repo.get_grade_by_id(db, grade_id)
@@ -65,23 +59,15 @@ def get_grade_by_enrollment(db: Session, enrollment_id: int):
     return grade
 
 def update_grade(db: Session, grade_id: int, marks: float):
-    if marks < 0 or marks > 100:
-        raise HTTPException(status_code=400, detail="Marks must be between 0 and 100")
-    
-    grade = grade_repo.get_grade_by_id(db, grade_id)
-    if not grade:
-        raise HTTPException(status_code=404, detail="Grade not found")
-    
     final_grade = calculate_final_grade(marks)
     
-    return grade_repo.update_grade(db, grade_id, marks, final_grade)
+    db_grade = grade_repo.update_grade(db, grade_id, marks, final_grade)
+    if not db_grade:
+        raise HTTPException(status_code=404, detail="Grade not found")
+    return db_grade
 
 def delete_grade(db: Session, grade_id: int):
-    grade = grade_repo.get_grade_by_id(db, grade_id)
-    if not grade:
-        raise HTTPException(status_code=404, detail="Grade not found")
-    
     success = grade_repo.delete_grade(db, grade_id)
     if not success:
-        raise HTTPException(status_code=500, detail="Failed to delete grade")
+        raise HTTPException(status_code=404, detail="Grade not found")
     return {"message": "Grade deleted successfully"}
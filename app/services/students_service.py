@@ -1,16 +1,18 @@
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
+from typing import Optional
 from app.schemas import StudentCreate
 from app.repositories import students_repository as student_repo
 from fastapi import HTTPException
 
 def create_student(db: Session, student: StudentCreate):
-    existing_student = student_repo.get_student_by_email(db, student.email)
-    if existing_student:
+    db_student = student_repo.create_student(db, student)
+    if not db_student:
         raise HTTPException(status_code=400, detail="Email already registered")
-    return student_repo.create_student(db, student)
+    return db_student
 
-def get_all_students(db: Session, skip: int = 0, limit: int = 100):
-    return student_repo.get_all_students(db, skip, limit)
+def get_all_students(db: Session, skip: int = 0, limit: int = 100, after_id: Optional[int] = None):
+    return student_repo.list_students_rows(db, skip, limit, after_id)
 
 def get_student_by_id(db: Session, student_id: int):
     student = student_repo.get_student_by_id(db, student_id)
@@ -19,22 +21,17 @@ def get_student_by_id(db: Session, student_id: int):
     return student
 
 def update_student(db: Session, student_id: int, student: StudentCreate):
-    existing_student = student_repo.get_student_by_id(db, student_id)
-    if not existing_student:
-        raise HTTPException(status_code=404, detail="Student not found")
-    
-    email_check = student_repo.get_student_by_email(db, student.email)
-    if email_check and email_check.id != student_id:
+    try:
+        updated_student = student_repo.update_student(db, student_id, student)
+    except IntegrityError:
+        db.rollback()
         raise HTTPException(status_code=400, detail="Email already registered")
-    
-    return student_repo.update_student(db, student_id, student)
+    if not updated_student:
+        raise HTTPException(status_code=404, detail="Student not found")
+    return updated_student
 
 def delete_student(db: Session, student_id: int):
-    student = student_repo.get_student_by_id(db, student_id)
-    if not student:
-        raise HTTPException(status_code=404, detail="Student not found")
-    
     success = student_repo.delete_student(db, student_id)
     if not success:
-        raise HTTPException(status_code=500, detail="Failed to delete student")
+        raise HTTPException(status_code=404, detail="Student not found")
     return {"message": "Student deleted successfully"}